@@ -67,6 +67,11 @@ def selection_mark(selection):
     is_flag=True,
     help="Exclude all attributes that match specified pattern.",
 )
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Ignore the cached catalog and rerun discovery.",
+)
 @pass_project(migrate=True)
 @run_async
 async def select(
@@ -83,7 +88,12 @@ async def select(
     """
     try:
         if flags["list"]:
-            await show(project, extractor, show_all=flags["all"])
+            await show(
+                project,
+                extractor,
+                show_all=flags["all"],
+                refresh=flags["refresh"],
+            )
         else:
             update(
                 project,
@@ -110,13 +120,16 @@ def update(
     select_service.update(entities_filter, attributes_filter, exclude, remove)
 
 
-async def show(project, extractor, show_all=False):
+async def show(project, extractor, show_all=False, refresh=False):
     """Show selected."""
     _, Session = project_engine(project)  # noqa: N806
     select_service = SelectService(project, extractor)
 
+    if refresh:
+        select_service.invalidate_catalog_cache()
+
     with closing(Session()) as session:
-        list_all = await select_service.list_all(session)
+        list_all = await select_service.list_all(session, refresh=refresh)
 
     # legend
     click.secho("Legend:")
@@ -10,6 +10,11 @@ from functools import cached_property
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml is not available
+    from yaml import SafeLoader
+
 from meltano.core import bundle
 from meltano.core.meltano_file import MeltanoFile
 from meltano.core.setting_definition import SettingDefinition
@@ -39,7 +44,10 @@ class ConfigService:
             The project settings.
         """
         with open(str(bundle.root / "settings.yml")) as settings_yaml:
-            settings_yaml_content = yaml.safe_load(settings_yaml)
+            settings_yaml_content = yaml.load(  # noqa: S506
+                settings_yaml,
+                Loader=SafeLoader,
+            )
         return [SettingDefinition.parse(x) for x in settings_yaml_content["settings"]]
 
     @cached_property
@@ -11,6 +11,11 @@ from logging import config as logging_config
 import structlog
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml is not available
+    from yaml import SafeLoader
+
 from meltano.core.logging.formatters import (
     LEVELED_TIMESTAMPED_PRE_CHAIN,
     TIMESTAMPER,
@@ -53,7 +58,7 @@ def read_config(config_file: str | None = None) -> dict:
     """
     if config_file and os.path.exists(config_file):
         with open(config_file) as cf:
-            return yaml.safe_load(cf.read())
+            return yaml.load(cf, Loader=SafeLoader)  # noqa: S506
     else:
         return None
 
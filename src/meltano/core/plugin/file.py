@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from pathlib import Path
 
 import structlog
 
@@ -19,7 +23,6 @@ from meltano.core.venv_service import VirtualEnv
 
 if t.TYPE_CHECKING:
     from os import PathLike
-    from pathlib import Path
 
     from meltano.core.project import Project
 
@@ -41,6 +44,31 @@ class FilePlugin(BasePlugin):  # noqa: WPS214
         ),
     ]
 
+    def update_config(self, project: Project, plugin: ProjectPlugin) -> dict:
+        """Return the plugin's `_update` extra config.
+
+        Resolving the extra walks every settings store, so the result is
+        memoized per project and plugin for the lifetime of this instance.
+
+        Args:
+            project: The Meltano project.
+            plugin: The project plugin to look up the `_update` config for.
+
+        Returns:
+            A mapping of file paths to whether they should be updated.
+        """
+        key = (project.root, plugin.name)
+        if key not in self._update_config_cache:
+            self._update_config_cache[key] = PluginSettingsService(
+                project,
+                plugin,
+            ).get("_update")
+        return self._update_config_cache[key]
+
+    @cached_property
+    def _update_config_cache(self) -> dict:
+        return {}
+
     def is_invokable(self) -> bool:
         """Return whether the plugin is invokable.
 
@@ -60,6 +88,10 @@ class FilePlugin(BasePlugin):  # noqa: WPS214
     def file_contents(self, project: Project) -> dict[Path, str]:
         """Return the contents of the files to be created or updated.
 
+        The bundle files are read concurrently using a thread pool, so the
+        total wall time is bound by the slowest read rather than the sum of
+        all of them.
+
         Args:
             project: The Meltano project.
 
@@ -69,22 +101,30 @@ class FilePlugin(BasePlugin):  # noqa: WPS214
         venv = VirtualEnv(project.plugin_dir(self, "venv"))
         bundle_dir = venv.site_packages_dir / "bundle"
 
-        return {
-            path.relative_to(bundle_dir): path.read_text()
-            for path in bundle_dir.glob("**/*")
-            if path.is_file()
-            and "__pycache__" not in path.parts
-            and path != bundle_dir.joinpath("__init__.py")
-        }
+        # An `os.walk` reuses the file type from each directory scan, unlike a
+        # recursive glob, which stats every path again to filter directories.
+        paths = []
+        for root, dirs, files in os.walk(bundle_dir):
+            dirs[:] = [subdir for subdir in dirs if subdir != "__pycache__"]
+            root_path = Path(root)
+            paths.extend(
+                root_path / name
+                for name in files
+                if root_path != bundle_dir or name != "__init__.py"
+            )
 
-    def update_file_header(self, relative_path: PathLike) -> str:
-        """Return the header to be added to the top of the file.
+        with ThreadPoolExecutor() as pool:
+            return {
+                path.relative_to(bundle_dir): content
+                for path, content in zip(paths, pool.map(Path.read_text, paths))
+            }
 
-        Args:
-            relative_path: The relative path of the file.
+    @cached_property
+    def _update_file_header_prefix(self) -> str:
+        """Return the part of the update header shared by all files.
 
         Returns:
-            The header to be added to the top of the file.
+            The first two header lines, which don't depend on the file path.
         """
         return "\n".join(
             (
@@ -98,6 +138,21 @@ class FilePlugin(BasePlugin):  # noqa: WPS214
                     f"remove the {self.type.descriptor} from `meltano.yml` or "
                     "disable automatic updates:"
                 ),
+            ),
+        )
+
+    def update_file_header(self, relative_path: PathLike) -> str:
+        """Return the header to be added to the top of the file.
+
+        Args:
+            relative_path: The relative path of the file.
+
+        Returns:
+            The header to be added to the top of the file.
+        """
+        return "\n".join(
+            (
+                self._update_file_header_prefix,
                 (
                     f"#     meltano config --plugin-type={self.type} "
                     f"{self.name} set _update {relative_path} false"
@@ -122,7 +177,7 @@ class FilePlugin(BasePlugin):  # noqa: WPS214
 
         def with_update_header(content: str, relative_path: PathLike):
             return (
-                "\n\n".join([self.update_file_header(relative_path), content])
+                "\n\n".join((self.update_file_header(relative_path), content))
                 if any(relative_path.match(path) for path in paths_to_update)
                 else content
             )
@@ -149,8 +204,15 @@ class FilePlugin(BasePlugin):  # noqa: WPS214
             True if the file was written, False otherwise.
         """
         project_path = project.root_dir(relative_path)
-        if project_path.exists() and project_path.read_text() == content:
-            return False
+        try:
+            # Compare sizes first: when they differ, the contents can't match
+            # and the existing file doesn't need to be read at all.
+            if project_path.stat().st_size == len(
+                content.encode(),
+            ) and project_path.read_text() == content:
+                return False
+        except OSError:
+            pass
 
         project_path.parent.mkdir(parents=True, exist_ok=True)
         project_path.write_text(content)
@@ -290,9 +352,7 @@ class FilePlugin(BasePlugin):  # noqa: WPS214
             plugin: The installed plugin.
             reason: The reason for the installation.
         """
-        update_config = PluginSettingsService(install_service.project, plugin).get(
-            "_update",
-        )
+        update_config = self.update_config(install_service.project, plugin)
         paths_to_update = [
             path for path, to_update in update_config.items() if to_update
         ]
@@ -5,6 +5,11 @@ from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml is not available
+    from yaml import SafeLoader
+
 from meltano.core import bundle
 from meltano.core.plugin.file import FilePlugin
 from meltano.core.project import Project
@@ -32,10 +37,13 @@ class MeltanoFilePlugin(FilePlugin):
         with (bundle.root / "initialize.yml").open() as f:
             return {
                 Path(relative_path): content
-                for relative_path, content in yaml.safe_load(f).items()
+                for relative_path, content in yaml.load(  # noqa: S506
+                    f,
+                    Loader=SafeLoader,
+                ).items()
             }
 
-    def update_config(self, project):  # noqa: ARG002, D102
+    def update_config(self, project, plugin=None):  # noqa: ARG002, D102
         return {}
 
     def files_to_create(
@@ -89,6 +89,8 @@ class Project(Versioned):  # noqa: WPS214
         self.sys_dir_root = Path(
             os.getenv(PROJECT_SYS_DIR_ROOT_ENV, self.root / ".meltano"),
         ).resolve()
+        self._dotenv_cache: tuple[tuple[int, int] | None, dict[str, str | None]]
+        self._dotenv_cache = (None, {})
 
     def refresh(self, **kwargs) -> None:
         """Refresh the project instance to reflect external changes.
@@ -376,10 +378,24 @@ class Project(Versioned):  # noqa: WPS214
     def dotenv_env(self):
         """Get values from this project's .env file.
 
+        The parsed values are cached, and re-read only when the mtime or size
+        of the .env file changes, since they are looked up for every setting
+        that is resolved.
+
         Returns:
             values found in this project's .env file
         """
-        return dotenv_values(self.dotenv)
+        try:
+            stat_result = self.dotenv.stat()
+            signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        except OSError:
+            self._dotenv_cache = (None, {})
+            return self._dotenv_cache[1]
+
+        if self._dotenv_cache[0] != signature:
+            self._dotenv_cache = (signature, dotenv_values(self.dotenv))
+
+        return self._dotenv_cache[1]
 
     def activate_environment(self, name: str) -> None:
         """Activate a Meltano environment.
@@ -130,7 +130,9 @@ class ProjectFiles:  # noqa: WPS214
         Raises:
             InvalidIncludePathError: If the included path is not a valid file.
         """
-        if not (file_path.is_file() and file_path.exists()):
+        # `is_file` implies existence, so a separate `exists` check would
+        # only repeat the same stat call.
+        if not file_path.is_file():
             raise InvalidIncludePathError(f"Included path '{file_path}' not found.")
 
     def _resolve_include_paths(self, include_path_patterns: list[str]) -> list[Path]:
@@ -116,6 +116,7 @@ class ProjectPluginsService:  # noqa: WPS214, WPS230 (too many methods, attribut
         self.lock_service = PluginLockService(project)
         self.locked_definition_service = LockedDefinitionService(project)
         self._prefer_source = DefinitionSource.LOCAL
+        self._find_cache: dict[tuple, ProjectPlugin] = {}
 
     @cached_property
     def current_plugins(self):
@@ -135,6 +136,7 @@ class ProjectPluginsService:  # noqa: WPS214, WPS230 (too many methods, attribut
         """
         with self.project.config_service.update_meltano_yml() as meltano_yml:
             yield meltano_yml.plugins
+        self._find_cache.clear()
 
     def add_to_file(self, plugin: ProjectPlugin):
         """Add plugin to `meltano.yml`.
@@ -229,6 +231,12 @@ class ProjectPluginsService:  # noqa: WPS214, WPS230 (too many methods, attribut
                 f"ignoring `@{profile_name}` in plugin name.",
             )
 
+        # Plugins are resolved repeatedly (e.g. once per setting lookup), so
+        # check for a previous resolution before scanning all plugins again.
+        cache_key = (plugin_name, plugin_type, invokable, configurable)
+        with suppress(KeyError):
+            return self._find_cache[cache_key]
+
         for plugin in self.plugins(ensure_parent=False):
             if (
                 plugin.name == plugin_name  # noqa: WPS222 (with too much logic)
@@ -242,10 +250,12 @@ class ProjectPluginsService:  # noqa: WPS214, WPS230 (too many methods, attribut
                     or self.ensure_parent(plugin).is_configurable() == configurable
                 )
             ):
-                return self.ensure_parent(plugin)
+                self._find_cache[cache_key] = self.ensure_parent(plugin)
+                return self._find_cache[cache_key]
             elif plugin.type == PluginType.MAPPERS:
                 mapping = self._find_mapping(plugin_name, plugin)
                 if mapping:
+                    self._find_cache[cache_key] = mapping
                     return mapping
         raise PluginNotFoundError(
             PluginRef(plugin_type, plugin_name) if plugin_type else plugin_name,
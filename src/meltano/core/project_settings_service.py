@@ -61,6 +61,8 @@ class ProjectSettingsService(SettingsService):  # noqa: WPS214
             **self.config_override,
         }
 
+        self._as_env_cache: dict[str, str] | None = None
+
         try:
             self.ensure_project_id()
         except ProjectReadonly:
@@ -108,6 +110,67 @@ class ProjectSettingsService(SettingsService):  # noqa: WPS214
                 self.set("project_id", project_id, store=SettingValueStore.MELTANO_YML)
                 logger.debug("Restored 'project_id' from 'analytics.json'")
 
+    def as_env(self, *args, **kwargs) -> dict[str, str]:
+        """Return settings as a dictionary of environment variables.
+
+        The no-argument form is memoized, since it is recomputed for every
+        plugin settings service that is constructed; the cache is invalidated
+        whenever a project setting is changed.
+
+        Args:
+            *args: Positional arguments to pass to the parent method.
+            **kwargs: Keyword arguments to pass to the parent method.
+
+        Returns:
+            Settings as environment variables.
+        """
+        if args or kwargs:
+            return super().as_env(*args, **kwargs)
+
+        if self._as_env_cache is None:
+            self._as_env_cache = super().as_env()
+
+        return self._as_env_cache
+
+    def set_with_metadata(self, *args, **kwargs):
+        """Set a setting and invalidate the memoized environment.
+
+        Args:
+            *args: Positional arguments to pass to the parent method.
+            **kwargs: Keyword arguments to pass to the parent method.
+
+        Returns:
+            The new value and metadata for the setting.
+        """
+        self._as_env_cache = None
+        return super().set_with_metadata(*args, **kwargs)
+
+    def unset(self, *args, **kwargs):
+        """Unset a setting and invalidate the memoized environment.
+
+        Args:
+            *args: Positional arguments to pass to the parent method.
+            **kwargs: Keyword arguments to pass to the parent method.
+
+        Returns:
+            The metadata for the setting.
+        """
+        self._as_env_cache = None
+        return super().unset(*args, **kwargs)
+
+    def reset(self, *args, **kwargs):
+        """Reset all settings and invalidate the memoized environment.
+
+        Args:
+            *args: Positional arguments to pass to the parent method.
+            **kwargs: Keyword arguments to pass to the parent method.
+
+        Returns:
+            The metadata for the reset.
+        """
+        self._as_env_cache = None
+        return super().reset(*args, **kwargs)
+
     @property
     def label(self) -> str:
         """Return label.
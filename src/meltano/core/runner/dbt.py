@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import sys
+from pathlib import Path
+
+import structlog
 
 from meltano.core.elt_context import ELTContext
 from meltano.core.logging import capture_subprocess_output
 from meltano.core.plugin import PluginType
 from meltano.core.plugin_invoker import PluginInvoker
+from meltano.core.utils import hash_sha256
 
 from . import Runner, RunnerError
 
+logger = structlog.getLogger(__name__)
+
 
 class DbtRunner(Runner):
     def __init__(self, elt_context: ELTContext):
@@ -37,16 +43,10 @@ class DbtRunner(Runner):
         except Exception as err:
             raise RunnerError(f"Cannot start dbt: {err}") from err
 
-        await asyncio.wait(
-            [
-                asyncio.create_task(coro)
-                for coro in (
-                    capture_subprocess_output(handle.stdout, log),
-                    capture_subprocess_output(handle.stderr, log),
-                    handle.wait(),
-                )
-            ],
-            return_when=asyncio.ALL_COMPLETED,
+        await asyncio.gather(
+            capture_subprocess_output(handle.stdout, log),
+            capture_subprocess_output(handle.stderr, log),
+            handle.wait(),
         )
 
         if exitcode := handle.returncode:
@@ -60,8 +60,78 @@ class DbtRunner(Runner):
         dbt = self.context.transformer_invoker()
 
         async with dbt.prepared(self.context.session):
-            await self.invoke(dbt, log=log, command="clean")
-            await self.invoke(dbt, log=log, command="deps")
+            loop = asyncio.get_running_loop()
+
+            # The fingerprint checks hash packages.yml on disk; run them in a
+            # thread so the event loop stays free for concurrent pipelines.
+            record_packages = None
+            if await loop.run_in_executor(None, self._packages_changed, dbt):
+                await self.invoke(dbt, log=log, command="clean")
+                await self.invoke(dbt, log=log, command="deps")
+                # Record the fingerprint while the transform below runs
+                record_packages = loop.run_in_executor(
+                    None,
+                    self._record_packages,
+                    dbt,
+                )
 
             cmd = "compile" if self.context.dry_run else "run"
-            await self.invoke(dbt, log=log, command=cmd)
+            try:
+                await self.invoke(dbt, log=log, command=cmd)
+            finally:
+                if record_packages is not None:
+                    await record_packages
+
+    def _dbt_project_dir(self, dbt: PluginInvoker) -> Path:
+        return Path(dbt.settings_service.get("project_dir"))
+
+    def _packages_fingerprint_path(self, dbt: PluginInvoker) -> Path:
+        return dbt.plugin_config_service.run_dir / ".packages_fingerprint"
+
+    def _packages_changed(self, dbt: PluginInvoker) -> bool:
+        """Determine whether `dbt clean` and `dbt deps` need to run.
+
+        They can be skipped when `packages.yml` is unchanged since the last
+        successful `dbt deps` and the installed packages are still in place.
+
+        Args:
+            dbt: The transformer invoker.
+
+        Returns:
+            True if `dbt clean` and `dbt deps` should be run.
+        """
+        project_dir = self._dbt_project_dir(dbt)
+        packages_file = project_dir / "packages.yml"
+        if not packages_file.is_file():
+            return True
+
+        try:
+            recorded = self._packages_fingerprint_path(dbt).read_text()
+            if recorded != hash_sha256(packages_file.read_text()):
+                return True
+        except OSError:
+            return True
+
+        # `dbt clean` (or the user) may have removed the installed packages
+        return not any(
+            (project_dir / name).is_dir() for name in ("dbt_packages", "dbt_modules")
+        )
+
+    def _record_packages(self, dbt: PluginInvoker) -> None:
+        """Record the fingerprint of `packages.yml` after a `dbt deps` run.
+
+        The fingerprint is an optimization, so a failure to record it is
+        logged rather than raised: the worst case is that the next run
+        re-installs the packages.
+
+        Args:
+            dbt: The transformer invoker.
+        """
+        try:
+            packages_file = self._dbt_project_dir(dbt) / "packages.yml"
+            if packages_file.is_file():
+                self._packages_fingerprint_path(dbt).write_text(
+                    hash_sha256(packages_file.read_text()),
+                )
+        except OSError as err:
+            logger.warning(f"Could not record the dbt packages fingerprint: {err}")
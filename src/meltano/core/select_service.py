@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import glob
 import json
+from contextlib import suppress
+from pathlib import Path
 
 from meltano.core.plugin import PluginType
 from meltano.core.plugin.base import PluginRef
@@ -10,6 +13,20 @@ from meltano.core.plugin.settings_service import PluginSettingsService
 from meltano.core.plugin.singer.catalog import ListSelectedExecutor
 from meltano.core.plugin_invoker import invoker_factory
 from meltano.core.project import Project
+from meltano.core.utils import hash_sha256
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def _loads(catalog_json: str) -> dict:
+    # Catalogs can be tens of megabytes; orjson parses them several times
+    # faster than the stdlib when it's installed.
+    if orjson is not None:
+        return orjson.loads(catalog_json)
+    return json.loads(catalog_json)
 
 
 class SelectService:
@@ -36,19 +53,93 @@ class SelectService:
         plugin_settings_service = PluginSettingsService(self.project, self.extractor)
         return plugin_settings_service.get("_select")
 
-    async def load_catalog(self, session):
-        """Load the catalog."""
+    async def load_catalog(self, session, refresh=False):
+        """Load the catalog.
+
+        Discovered catalogs are cached on disk under `.meltano/cache`, keyed
+        by the extractor's configuration and installed version, so repeated
+        invocations skip discovery until either of those changes.
+
+        Args:
+            session: Database session.
+            refresh: Ignore any cached catalog and re-run discovery.
+
+        Returns:
+            The extractor's catalog.
+        """
         invoker = invoker_factory(self.project, self.extractor)
 
         async with invoker.prepared(session):
+            cache_path = self._catalog_cache_path(invoker)
+
+            if not refresh:
+                # A corrupt cache file (ValueError) falls back to discovery
+                with suppress(OSError, ValueError):
+                    return _loads(cache_path.read_text())
+
             catalog_json = await invoker.dump("catalog")
 
-        return json.loads(catalog_json)
+            with suppress(OSError):
+                cache_path.write_text(catalog_json)
+
+        return _loads(catalog_json)
+
+    def _catalog_cache_path(self, invoker) -> Path:
+        """Path of the cached catalog for the extractor's current state.
+
+        The file name embeds a hash of the extractor's configuration and of
+        its venv fingerprint (content and mtime), so a config change, install,
+        or upgrade of the extractor resolves to a new path and leaves any
+        stale cache behind.
+
+        Args:
+            invoker: The extractor's prepared invoker.
+
+        Returns:
+            The path the catalog is cached at.
+        """
+        # Inherited plugins share their parent's venv, so use `venv_name`
+        fingerprint_path = (
+            self.project.venvs_dir(self.extractor.type, self.extractor.venv_name)
+            / ".meltano_plugin_fingerprint"
+        )
+        try:
+            fingerprint = (
+                fingerprint_path.read_text(),
+                fingerprint_path.stat().st_mtime_ns,
+            )
+        except OSError:
+            fingerprint = None
+
+        cache_key = hash_sha256(
+            json.dumps(
+                {
+                    "config": invoker.plugin_config,
+                    "extras": invoker.plugin_config_extras,
+                    "fingerprint": fingerprint,
+                },
+                sort_keys=True,
+                default=str,
+            ),
+        )
+
+        return self.project.meltano_dir("cache", "catalog").joinpath(
+            f"{self.extractor.venv_name}--{cache_key}.json",
+        )
+
+    def invalidate_catalog_cache(self) -> None:
+        """Remove any cached catalogs built from the extractor's venv."""
+        escaped_name = glob.escape(self.extractor.venv_name)
+        for path in self.project.meltano_dir("cache", "catalog").glob(
+            f"{escaped_name}--*.json",
+        ):
+            with suppress(OSError):
+                path.unlink()
 
-    async def list_all(self, session) -> ListSelectedExecutor:
+    async def list_all(self, session, refresh=False) -> ListSelectedExecutor:
         """List all select."""
         try:
-            catalog = await self.load_catalog(session)
+            catalog = await self.load_catalog(session, refresh=refresh)
         except FileNotFoundError as err:
             raise PluginExecutionError(
                 "Could not find catalog. Verify that the tap supports discovery "
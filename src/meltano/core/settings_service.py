@@ -7,6 +7,7 @@ import os
 import typing as t
 import warnings
 from abc import ABCMeta, abstractmethod
+from collections import ChainMap
 from contextlib import contextmanager, suppress
 from enum import Enum
 
@@ -104,6 +105,8 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
         self.env_override = env_override or {}
         self.config_override = config_override or {}
         self._setting_defs = None
+        self._setting_index: dict[str, SettingDefinition] | None = None
+        self._setting_index_source: list[SettingDefinition] | None = None
 
     @property
     @abstractmethod
@@ -185,12 +188,15 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
 
     @property
     def env(self):
-        """Return the environment as a dict.
+        """Return the environment as a mapping.
+
+        A `ChainMap` is returned rather than merging the overrides into a
+        fresh dict, since this property is consulted for every setting lookup.
 
         Returns:
-            the environment as a dict.
+            the environment as a mapping.
         """
-        return {**os.environ, **self.env_override}
+        return ChainMap(self.env_override, os.environ)
 
     @classmethod
     def unredact(cls, values: dict) -> dict:
@@ -337,7 +343,10 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
 
         metadata = {"name": name, "source": source, "setting": setting_def}
 
-        expandable_env = {**self.project.dotenv_env, **self.env}
+        # Chain the mappings rather than copying them into a new dict; the
+        # empty first map receives any extra-setting overrides below without
+        # writing into the underlying environments.
+        expandable_env = ChainMap({}, self.env, self.project.dotenv_env)
         if setting_def and setting_def.is_extra:
             expandable_env.update(
                 self.as_env(
@@ -614,13 +623,24 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
             SettingMissingError: if the setting is not found
 
         """
+        definitions = self.definitions()
+
+        # Settings are looked up by name constantly, so an index over names
+        # and aliases is kept instead of scanning the definitions every time.
+        # It is rebuilt whenever `definitions` returns a fresh list, which is
+        # how definition changes are signalled (`_setting_defs` is reset).
+        if self._setting_index is None or self._setting_index_source is not definitions:
+            index: dict[str, SettingDefinition] = {}
+            for setting in definitions:
+                index.setdefault(setting.name, setting)
+                for alias in setting.aliases:
+                    index.setdefault(alias, setting)
+            self._setting_index = index
+            self._setting_index_source = definitions
+
         try:
-            return next(
-                setting
-                for setting in self.definitions()
-                if setting.name == name or name in setting.aliases
-            )
-        except StopIteration as err:
+            return self._setting_index[name]
+        except KeyError as err:
             raise SettingMissingError(name) from err
 
     # TODO: The `for_writing` parameter is unsued, but referenced elsewhere.
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import os
+import re
+import textwrap
+from io import StringIO
 from pathlib import Path
 
 from meltano.core import yaml
@@ -62,11 +65,48 @@ class TransformAddService:
         package_ref = {"git": git_repo}
         if revision:
             package_ref["revision"] = revision
+
+        if self._append_package(package_yaml, package_ref):
+            return
+
         package_yaml["packages"].append(package_ref)
 
         with open(self.packages_file, "w") as f:
             yaml.dump(package_yaml, f)
 
+    def _append_package(self, package_yaml, package_ref) -> bool:
+        """Append the package to `packages.yml` without rewriting the file.
+
+        This only happens when the file consists solely of a `packages` list
+        whose entries the new one can be aligned with; anything more involved
+        falls back to a full load/dump round-trip.
+
+        Args:
+            package_yaml: The parsed contents of `packages.yml`.
+            package_ref: The package entry to append.
+
+        Returns:
+            True if the entry was appended, False if the caller should rewrite
+            the file instead.
+        """
+        if set(package_yaml) != {"packages"}:
+            return False
+
+        text = self.packages_file.read_text()
+        if not text.endswith("\n"):
+            return False
+
+        entry_match = re.search(r"^(\s*)- ", text, re.MULTILINE)
+        if entry_match is None:
+            return False
+
+        buf = StringIO()
+        yaml.dump([package_ref], buf)
+        with open(self.packages_file, "a") as f:
+            f.write(textwrap.indent(buf.getvalue(), entry_match.group(1)))
+
+        return True
+
     def update_dbt_project(self, plugin: ProjectPlugin) -> None:
         """Set transform package variables in `dbt_project.yml`.
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -11,7 +12,6 @@ from ruamel.yaml import YAML, CommentedMap
 from meltano.core.behavior.canonical import Canonical
 from meltano.core.plugin import PluginType
 from meltano.core.setting_definition import SettingKind
-from meltano.core.utils import hash_sha256
 
 yaml = YAML()
 yaml.default_flow_style = False
@@ -23,7 +23,10 @@ yaml.register_class(SettingKind)
 
 @dataclass
 class CachedCommentedMap:
-    """The hash of the raw bytes of a YAML file, and its parsed content."""
+    """The identity of a YAML file on disk, and its parsed content."""
+
+    stat: tuple[int, int]
+    """The `st_mtime_ns` and `st_size` of the file when it was parsed."""
 
     sha256: str
     data: CommentedMap
@@ -32,10 +35,35 @@ class CachedCommentedMap:
 cache: dict[os.PathLike, CachedCommentedMap] = {}
 
 
+def _stat_signature(path: Path) -> tuple[int, int]:
+    stat_result = path.stat()
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _file_sha256(path: Path) -> str:
+    """Hash the file in chunks, keeping memory use independent of its size.
+
+    Args:
+        path: The path to the file to hash.
+
+    Returns:
+        The hex digest of the file's contents.
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb") as src:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(src, hashlib.sha256).hexdigest()
+        for chunk in iter(lambda: src.read(65536), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
 def load(path: os.PathLike) -> CommentedMap:
     """Load the specified YAML file with caching.
 
-    The cache is used if both the file path and its content hash match what is stored.
+    The cache is used if the file path and its mtime and size match what is
+    stored, avoiding even opening the file. If the file was touched but its
+    content hash is unchanged, the cached parse is reused as well.
 
     Parameters:
         path: The path to the YAML file.
@@ -44,16 +72,21 @@ def load(path: os.PathLike) -> CommentedMap:
         The loaded YAML file.
     """
     path = Path(path).resolve()
-    with open(path) as yaml_file:
-        hashed = hash_sha256(yaml_file.read())
+    signature = _stat_signature(path)
 
-        if path in cache and cache[path].sha256 == hashed:
-            return cache[path].data
+    if path in cache and cache[path].stat == signature:
+        return cache[path].data
 
-        yaml_file.seek(0)
+    hashed = _file_sha256(path)
+
+    if path in cache and cache[path].sha256 == hashed:
+        cache[path].stat = signature
+        return cache[path].data
+
+    with open(path) as yaml_file:
         parsed = yaml.load(yaml_file)
 
-    cache[path] = CachedCommentedMap(hashed, parsed)
+    cache[path] = CachedCommentedMap(signature, hashed, parsed)
     return parsed
 
 
@@ -11,6 +11,7 @@ from meltano.core.job import Job, Payload, State
 from meltano.core.logging.utils import capture_subprocess_output
 from meltano.core.plugin.project_plugin import ProjectPlugin
 from meltano.core.plugin_invoker import PluginInvoker
+from meltano.core.runner.dbt import DbtRunner
 from meltano.core.runner.singer import SingerRunner
 
 TEST_STATE_ID = "test_job"
@@ -34,6 +35,104 @@ def create_plugin_files(config_dir: Path, plugin: ProjectPlugin):
     return config_dir
 
 
+def edit_packages_file(dbt_project_dir: Path, run_dir: Path):  # noqa: ARG001
+    (dbt_project_dir / "packages.yml").write_text("packages: []\n")
+
+
+def remove_installed_packages(dbt_project_dir: Path, run_dir: Path):  # noqa: ARG001
+    (dbt_project_dir / "dbt_packages").rmdir()
+
+
+def remove_fingerprint(dbt_project_dir: Path, run_dir: Path):  # noqa: ARG001
+    (run_dir / ".packages_fingerprint").unlink()
+
+
+class TestDbtRunner:
+    @pytest.fixture()
+    def dbt_project_dir(self, tmp_path: Path) -> Path:
+        project_dir = tmp_path / "transform"
+        project_dir.mkdir()
+        return project_dir
+
+    @pytest.fixture()
+    def run_dir(self, tmp_path: Path) -> Path:
+        run_dir = tmp_path / "run"
+        run_dir.mkdir()
+        return run_dir
+
+    @pytest.fixture()
+    def subject(self, dbt_project_dir: Path, run_dir: Path):
+        dbt_invoker = mock.MagicMock()
+        dbt_invoker.settings_service.get.return_value = str(dbt_project_dir)
+        dbt_invoker.plugin_config_service.run_dir = run_dir
+
+        context = mock.MagicMock()
+        context.dry_run = False
+        context.transformer_invoker.return_value = dbt_invoker
+
+        return DbtRunner(context)
+
+    async def run_commands(self, subject: DbtRunner) -> list[str]:
+        with mock.patch.object(DbtRunner, "invoke", new=AsyncMock()) as invoke:
+            await subject.run()
+
+        return [call.kwargs["command"] for call in invoke.call_args_list]
+
+    @pytest.mark.asyncio()
+    async def test_run_installs_packages_first_time(
+        self,
+        subject,
+        dbt_project_dir,
+        run_dir,
+    ):
+        (dbt_project_dir / "packages.yml").write_text("packages:\n")
+
+        assert await self.run_commands(subject) == ["clean", "deps", "run"]
+        assert (run_dir / ".packages_fingerprint").is_file()
+
+    @pytest.mark.asyncio()
+    async def test_run_survives_fingerprint_errors(
+        self,
+        subject,
+        dbt_project_dir,
+        run_dir,
+    ):
+        (dbt_project_dir / "packages.yml").write_text("packages:\n")
+        run_dir.rmdir()  # the fingerprint can't be recorded
+
+        assert await self.run_commands(subject) == ["clean", "deps", "run"]
+
+    @pytest.mark.asyncio()
+    async def test_run_skips_unchanged_packages(self, subject, dbt_project_dir):
+        (dbt_project_dir / "packages.yml").write_text("packages:\n")
+        assert await self.run_commands(subject) == ["clean", "deps", "run"]
+
+        # `dbt deps` was mocked out, so install the packages by hand
+        (dbt_project_dir / "dbt_packages").mkdir()
+        assert await self.run_commands(subject) == ["run"]
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "make_stale",
+        (edit_packages_file, remove_installed_packages, remove_fingerprint),
+    )
+    async def test_run_reinstalls_stale_packages(
+        self,
+        subject,
+        dbt_project_dir,
+        run_dir,
+        make_stale,
+    ):
+        (dbt_project_dir / "packages.yml").write_text("packages:\n")
+        assert await self.run_commands(subject) == ["clean", "deps", "run"]
+
+        (dbt_project_dir / "dbt_packages").mkdir()
+        assert await self.run_commands(subject) == ["run"]
+
+        make_stale(dbt_project_dir, run_dir)
+        assert await self.run_commands(subject) == ["clean", "deps", "run"]
+
+
 class TestSingerRunner:
     @pytest.fixture()
     def elt_context(
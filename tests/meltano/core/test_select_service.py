@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+
+import mock
+import pytest
+from mock import AsyncMock
+
+from meltano.core.select_service import SelectService
+
+CATALOG = {"streams": []}
+
+
+class TestSelectService:
+    @pytest.fixture()
+    def subject(self, project, tap):
+        service = SelectService(project, tap.name)
+        # The project fixture is shared, so drop any catalog cached by
+        # another test
+        service.invalidate_catalog_cache()
+        return service
+
+    @pytest.fixture()
+    def invoker(self):
+        invoker = mock.MagicMock()
+        invoker.plugin_config = {"key": "value"}
+        invoker.plugin_config_extras = {}
+        invoker.dump = AsyncMock(return_value=json.dumps(CATALOG))
+        return invoker
+
+    @pytest.mark.asyncio()
+    async def test_load_catalog_caches_discovery(self, subject, session, invoker):
+        with mock.patch(
+            "meltano.core.select_service.invoker_factory",
+            return_value=invoker,
+        ):
+            assert await subject.load_catalog(session) == CATALOG
+            assert invoker.dump.await_count == 1
+
+            # The second call is served from the on-disk cache
+            assert await subject.load_catalog(session) == CATALOG
+            assert invoker.dump.await_count == 1
+
+            # `refresh` ignores the cached catalog and re-runs discovery
+            assert await subject.load_catalog(session, refresh=True) == CATALOG
+            assert invoker.dump.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_load_catalog_cache_key(self, subject, session, invoker):
+        with mock.patch(
+            "meltano.core.select_service.invoker_factory",
+            return_value=invoker,
+        ):
+            await subject.load_catalog(session)
+            assert invoker.dump.await_count == 1
+
+            # A configuration change resolves to a new cache path
+            invoker.plugin_config = {"key": "changed"}
+            await subject.load_catalog(session)
+            assert invoker.dump.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_load_catalog_inherited_fingerprint(
+        self,
+        project,
+        tap,
+        inherited_tap,
+        session,
+        invoker,
+    ):
+        subject = SelectService(project, inherited_tap.name)
+        subject.invalidate_catalog_cache()
+
+        with mock.patch(
+            "meltano.core.select_service.invoker_factory",
+            return_value=invoker,
+        ):
+            await subject.load_catalog(session)
+            assert invoker.dump.await_count == 1
+
+            # An inherited plugin shares its parent's venv, so a (re)install
+            # of the parent invalidates the inherited extractor's catalog
+            fingerprint_path = (
+                project.venvs_dir(tap.type, tap.name) / ".meltano_plugin_fingerprint"
+            )
+            fingerprint_path.write_text("fingerprint")
+
+            await subject.load_catalog(session)
+            assert invoker.dump.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_invalidate_catalog_cache(self, subject, session, invoker):
+        with mock.patch(
+            "meltano.core.select_service.invoker_factory",
+            return_value=invoker,
+        ):
+            await subject.load_catalog(session)
+            subject.invalidate_catalog_cache()
+
+            await subject.load_catalog(session)
+            assert invoker.dump.await_count == 2
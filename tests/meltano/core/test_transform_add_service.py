@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import mock
+import pytest
+
+from meltano.core import yaml
+from meltano.core.transform_add_service import TransformAddService
+
+PIP_URL = "https://gitlab.com/meltano/dbt-tap-mock.git@v0.1"
+PACKAGE_REF = {"git": "https://gitlab.com/meltano/dbt-tap-mock.git", "revision": "v0.1"}
+
+INDENTED_PACKAGES = "packages:\n  - git: https://example.com/existing.git\n"
+UNINDENTED_PACKAGES = "packages:\n- git: https://example.com/existing.git\n"
+
+
+class TestTransformAddService:
+    @pytest.fixture()
+    def subject(self, tmp_path):
+        service = TransformAddService.__new__(TransformAddService)
+        service.packages_file = tmp_path / "packages.yml"
+        return service
+
+    @pytest.fixture()
+    def plugin(self):
+        plugin = mock.Mock()
+        plugin.pip_url = PIP_URL
+        return plugin
+
+    @pytest.mark.parametrize(
+        "original",
+        (INDENTED_PACKAGES, UNINDENTED_PACKAGES),
+        ids=("indented", "unindented"),
+    )
+    def test_append_package(self, subject, plugin, original):
+        subject.packages_file.write_text(original)
+        subject.add_to_packages(plugin)
+
+        # The existing entries are left untouched
+        assert subject.packages_file.read_text().startswith(original)
+
+        packages = yaml.load(subject.packages_file)["packages"]
+        assert len(packages) == 2
+        assert dict(packages[-1]) == PACKAGE_REF
+
+    def test_rewrite_on_extra_keys(self, subject, plugin):
+        subject.packages_file.write_text(f"{INDENTED_PACKAGES}config-version: 2\n")
+        subject.add_to_packages(plugin)
+
+        package_yaml = yaml.load(subject.packages_file)
+        assert package_yaml["config-version"] == 2
+        assert dict(package_yaml["packages"][-1]) == PACKAGE_REF
+
+    def test_rewrite_empty_file(self, subject, plugin):
+        subject.add_to_packages(plugin)
+
+        packages = yaml.load(subject.packages_file)["packages"]
+        assert [dict(package) for package in packages] == [PACKAGE_REF]
+
+    def test_append_matches_rewrite(self, subject, plugin, tmp_path):
+        subject.packages_file.write_text(INDENTED_PACKAGES)
+        subject.add_to_packages(plugin)
+
+        rewriter = TransformAddService.__new__(TransformAddService)
+        rewriter.packages_file = tmp_path / "rewritten.yml"
+        rewriter.packages_file.write_text(INDENTED_PACKAGES)
+        with mock.patch.object(
+            TransformAddService,
+            "_append_package",
+            return_value=False,
+        ):
+            rewriter.add_to_packages(plugin)
+
+        assert yaml.load(subject.packages_file) == yaml.load(rewriter.packages_file)